@@ -3,14 +3,17 @@ from __future__ import annotations
 import os
 import shutil
 import logging
+import time
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from datetime import timedelta
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
 from .sensor import SwitchPortCoordinator
 
 from .snmp_helper import (
+    async_listen_link_traps,
+    close_engine,
     discover_physical_ports,
 )
 
@@ -25,6 +28,8 @@ from .const import (
     DEFAULT_BASE_OIDS,
     DEFAULT_SYSTEM_OIDS,
     DEFAULT_SNMP_PORT,
+    CONF_TRAP_PORT,
+    DEFAULT_TRAP_PORT,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -34,6 +39,10 @@ CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+# Discovered port mappings are reused on restart for up to a day
+PORT_CACHE_VERSION = 1
+PORT_CACHE_MAX_AGE = 24 * 3600
+
 
 async def async_install_frontend_resource(hass: HomeAssistant):
     """Ensure the frontend JS file is copied to the www/community folder."""
@@ -119,7 +128,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     is_first_install = CONF_PORTS not in entry.options
     
     try:
-        detected = await discover_physical_ports(hass, host, community, snmp_port, mp_model)
+        store = _port_cache_store(hass, entry)
+        detected = await _async_load_cached_ports(store)
+        if detected:
+            # Use the cached mapping now; re-validate against the switch in the background
+            _LOGGER.debug("Using cached port mapping for %s (%d ports)", host, len(detected))
+            entry.async_create_background_task(
+                hass,
+                _async_rediscover_ports(hass, entry, store, detected, host, community, snmp_port, mp_model),
+                f"{DOMAIN}_rediscover_{host}",
+            )
+        else:
+            detected = await discover_physical_ports(hass, host, community, snmp_port, mp_model)
+            if detected:
+                await _async_save_cached_ports(store, detected)
         if detected:
             # --- EXTRACT METADATA ---
             # Get a sample port to pull device-wide info (all ports share the same device info)
@@ -279,14 +301,36 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Create coordinator
     coordinator = SwitchPortCoordinator(
-        hass, host, community, snmp_port, ports, base_oids, system_oids, 
-        snmp_version, include_vlans, update_seconds
+        hass,
+        host=host,
+        community=community,
+        snmp_port=snmp_port,
+        ports=ports,
+        base_oids=base_oids,
+        system_oids=system_oids,
+        snmp_version=snmp_version,
+        include_vlans=include_vlans,
+        update_seconds=update_seconds,
     )
     coordinator.device_name = entry.title
     coordinator.port_mapping = detected or {}  # Empty dict if detection failed
     coordinator.manufacturer = manufacturer
     coordinator.config_entry = entry
-    coordinator.update_interval = timedelta(seconds=update_seconds)
+
+    # Optional: linkUp/linkDown traps update port status between polls
+    trap_port = entry.options.get(CONF_TRAP_PORT, DEFAULT_TRAP_PORT)
+    if trap_port:
+        try:
+            entry.async_on_unload(
+                await async_listen_link_traps(
+                    hass, trap_port, host, community, coordinator.async_handle_link_trap
+                )
+            )
+        except OSError as err:
+            _LOGGER.warning(
+                "Cannot listen for SNMP traps on UDP %s: %s (port status is polled only)",
+                trap_port, err,
+            )
 
     # Store coordinator
     hass.data[DOMAIN][entry.entry_id] = coordinator
@@ -294,13 +338,65 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Forward to platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Background first refresh
-    await coordinator.async_config_entry_first_refresh()
+    # Background first refresh: entities show unavailable for one cycle
+    # instead of blocking entry setup on a full SNMP round
+    hass.async_create_task(coordinator.async_refresh())
 
     entry.async_on_unload(entry.add_update_listener(async_options_updated))
     return True
 
 
+def _port_cache_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Storage for the last discovered port mapping of this entry."""
+    return Store(hass, PORT_CACHE_VERSION, f"{DOMAIN}.{entry.entry_id}.ports")
+
+
+async def _async_load_cached_ports(store: Store) -> dict[int, dict] | None:
+    """Return the cached port mapping if it is younger than PORT_CACHE_MAX_AGE."""
+    cached = await store.async_load()
+    if not cached or time.time() - cached.get("cached_at", 0) > PORT_CACHE_MAX_AGE:
+        return None
+    # JSON turned the logical port numbers into strings
+    return {int(port): info for port, info in cached.get("ports", {}).items()} or None
+
+
+async def _async_save_cached_ports(store: Store, detected: dict[int, dict]) -> None:
+    """Persist a fresh discovery result."""
+    await store.async_save({"cached_at": time.time(), "ports": detected})
+
+
+def _port_layout(mapping: dict[int, dict]) -> dict[int, tuple]:
+    """Logical port -> the discovery fields entities are built from.
+
+    Speed follows link state and manufacturer comes from sysDescr, so neither
+    says anything about the layout.
+    """
+    return {
+        port: (info.get("if_index"), info.get("if_descr"), info.get("is_sfp"))
+        for port, info in mapping.items()
+    }
+
+
+async def _async_rediscover_ports(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    store: Store,
+    cached: dict[int, dict],
+    host: str,
+    community: str,
+    snmp_port: int,
+    mp_model: int,
+) -> None:
+    """Re-run discovery after a cached start; reload the entry if the ports changed."""
+    detected = await discover_physical_ports(hass, host, community, snmp_port, mp_model)
+    if not detected:
+        return
+    await _async_save_cached_ports(store, detected)
+    if _port_layout(detected) != _port_layout(cached):
+        _LOGGER.info("Port layout changed on %s since last discovery, reloading", host)
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+
+
 def _summarize_port_speeds(detected: dict) -> str:
     """
     Summarize port speeds for logging.
@@ -341,9 +437,17 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        if not hass.data[DOMAIN]:
+            # Last switch gone: release the shared SNMP engine's sockets
+            close_engine()
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the cached port mapping together with the entry."""
+    await _port_cache_store(hass, entry).async_remove()
+
+
 async def async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Called when options are changed – force full reload."""
     await hass.config_entries.async_reload(entry.entry_id)
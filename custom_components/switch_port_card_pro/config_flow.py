@@ -25,6 +25,8 @@ from .const import (
     CONF_SNMP_PORT,
     DEFAULT_SNMP_PORT,
     CONF_OID_SYSNAME,
+    CONF_TRAP_PORT,
+    DEFAULT_TRAP_PORT,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -249,6 +251,10 @@ class SwitchPortCardProOptionsFlow(config_entries.OptionsFlow):
                     "snmp_version",
                     default=current.get("snmp_version", "v2c"),
                 ): vol.In({"v2c": "v2c", "v1": "v1"}),
+                vol.Optional(
+                    CONF_TRAP_PORT,
+                    default=current.get(CONF_TRAP_PORT, DEFAULT_TRAP_PORT),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=65535)),
      #           vol.Optional(
      #               CONF_SFP_PORTS_START, 
      #               default=25,
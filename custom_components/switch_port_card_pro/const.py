@@ -11,6 +11,7 @@ CONF_COMMUNITY: Final = "community"
 CONF_PORTS: Final = "ports"
 CONF_INCLUDE_VLANS: Final = "include_vlans"
 CONF_SFP_PORTS_START = "sfp_ports_start"
+CONF_TRAP_PORT: Final = "trap_port"
 # Option keys (used in config flow)
 CONF_OID_RX: Final = "oid_rx"
 CONF_OID_TX: Final = "oid_tx"
@@ -40,6 +41,8 @@ SNMP_VERSION_TO_MP_MODEL = {
     "v3": 2,
 }
 DEFAULT_SNMP_PORT: Final = 161
+# UDP port for linkUp/linkDown traps; 0 keeps the trap receiver off
+DEFAULT_TRAP_PORT: Final = 0
 # Default monitored ports (1–28 is safe for most 24+4 switches)
 DEFAULT_PORTS: Final = list(range(1, 9)) # remove 29 as this is too many for most users
 
@@ -2,11 +2,14 @@
 from __future__ import annotations
 import logging
 import asyncio
-from dataclasses import dataclass
+import weakref
+from dataclasses import dataclass, replace
 from datetime import timedelta
+from operator import attrgetter
+from types import MappingProxyType
+from collections.abc import Callable, Mapping
 from typing import Any
 from homeassistant.helpers import device_registry
-from datetime import datetime
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -31,27 +34,205 @@ from .const import (
     SNMP_VERSION_TO_MP_MODEL,
 )
 from .snmp_helper import (
-    async_snmp_walk,
+    async_create_target,
     async_snmp_bulk,
+    async_snmp_bulk_walk,
+    async_snmp_get_columns,
+    create_auth,
 )
 _LOGGER = logging.getLogger(__name__)
 
-
-
-@dataclass
+# Poll interval (seconds) used after 1, 2, 3+ consecutive failed refreshes
+FAILURE_BACKOFF_SECONDS = (60, 120, 300)
+# Idle switches (no counter/link change) double the interval per poll, up to this cap
+IDLE_MAX_INTERVAL_SECONDS = 300
+IDLE_MAX_DOUBLINGS = 4
+
+BYTES_PER_MEGABIT = 1_000_000 / 8  # Mbps is decimal, matching UnitOfDataRate.MEGABITS_PER_SECOND
+COUNTER32_MAX = 2**32
+COUNTER64_MAX = 2**64
+# 32-bit ifIn/OutOctets -> their 64-bit ifHC twins; at 10G a Counter32 wraps in ~3 s
+HC_OCTET_OIDS = {
+    "1.3.6.1.2.1.2.2.1.10": "1.3.6.1.2.1.31.1.1.1.6",
+    "1.3.6.1.2.1.2.2.1.16": "1.3.6.1.2.1.31.1.1.1.10",
+}
+HC_OCTET_OID_SET = frozenset(HC_OCTET_OIDS.values())
+# PoE status codes that mean power is being delivered
+POE_ENABLED_STATES = frozenset({1, 2, 4})
+# Port names/VLANs and the system OIDs (hostname, firmware, uptime, ...) move slowly:
+# they are re-read at most this often (seconds), whatever the poll interval
+SLOW_REFRESH_SECONDS = 300
+# CPU/memory load needs finer granularity than the slow tier
+LOAD_REFRESH_SECONDS = 60
+LOAD_OID_KEYS = frozenset({"cpu", "cpu_zyxel", "memory", "memory_zyxel"})
+# System OIDs the agent has no value for (e.g. the other vendor's CPU OID) are re-probed this rarely
+DEAD_OID_RETRY_SECONDS = 3600
+SLOW_PORT_COLUMNS = frozenset({"name", "vlan"})
+# Anything above this is a counter glitch, not traffic
+MAX_SAFE_BPS = 20_000_000_000
+
+
+def _counter_max(oid: str) -> int:
+    """Counter range for an octet counter OID."""
+    # Only the ifHC*Octets columns are Counter64; the rest of ifXTable mixes in Counter32
+    return COUNTER64_MAX if oid.strip() in HC_OCTET_OID_SET else COUNTER32_MAX
+
+
+def _counter_delta(current: int, previous: int, counter_max: int) -> int:
+    """Increase of a lifetime counter, handling wrap-around and resets."""
+    delta = current - previous
+    if delta < 0:
+        # A Counter32 wraps within a poll on fast links, so going backwards is a
+        # wrap; a Counter64 never wraps in practice, so there it is a reset
+        delta = delta % counter_max if counter_max == COUNTER32_MAX else 0
+    return delta
+
+
+def _as_float(value: str | None) -> float | None:
+    """Numeric SNMP string as float; missing or garbage is unknown, not 0."""
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _as_uptime_seconds(value: str | None) -> int | None:
+    """sysUpTime-style hundredths of a second to whole seconds; missing is unknown."""
+    if value is None or value == "":
+        return None
+    try:
+        return int(value) // 100
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_column(raw: Mapping[str, Any], int_val: bool = True) -> dict[int, Any]:
+    """Map a walked column {oid: value} to {ifIndex: value}."""
+    try:
+        # Fast path: every row is well formed
+        if int_val:
+            return {int(oid.rpartition(".")[2]): int(val) for oid, val in raw.items()}
+        return {int(oid.rpartition(".")[2]): val for oid, val in raw.items()}
+    except (ValueError, TypeError):
+        pass
+    # Slow path: skip the malformed rows only
+    out = {}
+    for oid, val in raw.items():
+        last = oid.rpartition(".")[2]
+        if not last.isdigit():
+            continue
+        if not int_val or isinstance(val, int):
+            out[int(last)] = val
+            continue
+        try:
+            out[int(last)] = int(val)
+        except (ValueError, TypeError):
+            continue
+    return out
+
+
+@dataclass(slots=True, frozen=True)
+class PortRow:
+    """Per-port values from one poll."""
+    status: str = "off"
+    speed: int = 0
+    rx: int = 0
+    tx: int = 0
+    rx_bps: int = 0  # lifetime counters * 8, for legacy card attributes
+    tx_bps: int = 0
+    name: str = ""
+    vlan: int | None = None
+    poe_power: int = 0
+    poe_status: int = 0
+    port_custom: Any = 0
+    rx_bps_live: int = 0  # rates over the last poll interval
+    tx_bps_live: int = 0
+
+
+# Shared row for ports missing from the current snapshot
+EMPTY_PORT_ROW = PortRow()
+# Shared read-only fallback for missing columns/attributes (no allocation per miss)
+EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(slots=True, frozen=True)
+class SystemStats:
+    """Switch-wide values from one poll, parsed once per refresh."""
+    cpu: float | None = None  # percent
+    memory: float | None = None  # percent
+    hostname: str | None = None
+    uptime: int | None = None  # seconds
+    firmware: str | None = None
+    poe_total_watts: float | None = None
+    custom: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
 class SwitchPortData:
-    ports: dict[str, dict[str, Any]]
+    ports: dict[str, PortRow]
     bandwidth_mbps: float
-    system: dict[str, Any]
+    system: SystemStats
+    # Fully built state attributes per port, assembled once per refresh
+    port_attrs: dict[str, dict[str, Any]]
 
 
 class SwitchPortCoordinator(DataUpdateCoordinator[SwitchPortData]):
+    __slots__ = (
+        "_auth",
+        "_consecutive_failures",
+        "_dead_system_oids",
+        "_default_names",
+        "_device_id",
+        "_device_info",
+        "_entities",
+        "_fast_walk_keys",
+        "_fast_walk_oids",
+        "_has_poe",
+        "_hc_fallback",
+        "_if_index",
+        "_last_device_info",
+        "_last_fingerprint",
+        "_last_octets",
+        "_last_poll_ts",
+        "_load_due",
+        "_load_oid_list",
+        "_port_by_if_index",
+        "_port_mapping",
+        "_port_static_attrs",
+        "_port_str",
+        "_rx_counter_max",
+        "_slow_columns",
+        "_slow_due",
+        "_static_attrs_by_port",
+        "_system_oid_list",
+        "_system_values",
+        "_target",
+        "_tx_counter_max",
+        "_unchanged_polls",
+        "_unsub_fan_out",
+        "_walk_keys",
+        "_walk_oids",
+        "base_oids",
+        "community",
+        "host",
+        "include_vlans",
+        "mp_model",
+        "poll_seconds",
+        "ports",
+        "snmp_port",
+        "system_oids",
+        "update_seconds",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
+        *,
         host: str,
         community: str,
-        snmp_port,
+        snmp_port: int,
         ports: list[int],
         base_oids: dict[str, str],
         system_oids: dict[str, str],
@@ -64,20 +245,308 @@ class SwitchPortCoordinator(DataUpdateCoordinator[SwitchPortData]):
             _LOGGER,
             name=f"{DOMAIN}_{host}",
             update_interval=timedelta(seconds=update_seconds),
+            # SwitchPortData compares by value: an identical poll notifies nobody
+            always_update=False,
         )
         self.host = host
         self.community = community
         self.snmp_port = snmp_port
         self.ports = ports
-        self.base_oids = base_oids
         self.system_oids = system_oids
         self.include_vlans = include_vlans
         self.mp_model = SNMP_VERSION_TO_MP_MODEL.get(snmp_version, 1)
+
+        # Counter64 needs SNMPv2c+: poll the 64-bit twins of the default octet
+        # counters, remembering the 32-bit OID in case the switch lacks them
+        self._hc_fallback: dict[str, str] = {}
+        if self.mp_model != 0:
+            base_oids = dict(base_oids)
+            for key in ("rx", "tx"):
+                hc_oid = HC_OCTET_OIDS.get((base_oids.get(key) or "").strip())
+                if hc_oid:
+                    self._hc_fallback[key] = base_oids[key]
+                    base_oids[key] = hc_oid
+        self.base_oids = base_oids
+        self._build_walk_plan()
+        # Parsed name/VLAN columns from the last slow poll
+        self._slow_columns: dict[str, dict[int, Any]] | None = None
+        # Loop times at which the slow tier and the CPU/memory tier are due again
+        self._slow_due = 0.0
+        self._load_due = 0.0
+        # System OID -> (last answered value, loop time it was read)
+        self._system_values: dict[str, tuple[Any, float]] = {}
+        self._system_oid_list: list[str] = [oid for oid in system_oids.values() if oid]
+        self._load_oid_list: list[str] = [
+            oid for key, oid in system_oids.items() if oid and key in LOAD_OID_KEYS
+        ]
+        # System OID -> loop time after which an unanswered OID is asked for again
+        self._dead_system_oids: dict[str, float] = {}
+
+        # SNMP transport/auth reused by every request of this coordinator
+        self._auth = create_auth(community, self.mp_model)
+        self._target = None
+        self._port_mapping: dict[int, dict[str, Any]] = {}
+        self._port_str: list[str] = []
+        self._if_index: list[int] = []
+        self._default_names: list[str] = []
+        self._port_by_if_index: dict[int, str] = {}
+        self._port_static_attrs: list[dict[str, Any]] = []
+        self._static_attrs_by_port: dict[str, dict[str, Any]] = {}
+        self._last_octets: list[tuple[int, int] | None] = []
         self.port_mapping = {}
         self.update_seconds = update_seconds
-        self._last_total_bytes = 0
+        # Interval the current poll covers (the configured one unless backed off)
+        self.poll_seconds = float(update_seconds if update_seconds > 0 else 20)
+        # Without configured PoE OIDs nothing is walked and the values are always 0
+        self._has_poe = bool(base_oids.get("poe_power") or base_oids.get("poe_status"))
+        self._consecutive_failures = 0
+        self._unchanged_polls = 0
+        self._last_fingerprint: tuple | None = None
+        self._last_poll_ts: float | None = None
+        # Weak: a removed entity that missed unregister_entity can still be collected
+        self._entities: weakref.WeakSet[SwitchPortBaseEntity] = weakref.WeakSet()
+        self._unsub_fan_out = None
+        self._device_id: str | None = None
+        self._last_device_info: tuple[str, str, str | None] | None = None
+        self._device_info: DeviceInfo | None = None
+
+    def _build_walk_plan(self) -> None:
+        """Resolve the port columns to poll from base_oids."""
+        base_oids = self.base_oids
+        oids_to_walk = ["rx", "tx", "status", "speed", "name", "poe_power", "poe_status", "port_custom"]
+        if self.include_vlans and base_oids.get("vlan"):
+            oids_to_walk.append("vlan")
+        self._walk_keys: tuple[str, ...] = tuple(k for k in oids_to_walk if base_oids.get(k))
+        self._walk_oids: tuple[str, ...] = tuple(base_oids[k] for k in self._walk_keys)
+        # Columns that change every poll; the slow ones ride along with the system OIDs
+        self._fast_walk_keys: tuple[str, ...] = tuple(
+            k for k in self._walk_keys if k not in SLOW_PORT_COLUMNS
+        )
+        self._fast_walk_oids: tuple[str, ...] = tuple(base_oids[k] for k in self._fast_walk_keys)
+        # ifHC*Octets (IF-MIB ifXTable) are 64-bit, the ifTable octet counters 32-bit
+        self._rx_counter_max = _counter_max(base_oids.get("rx", ""))
+        self._tx_counter_max = _counter_max(base_oids.get("tx", ""))
+
+    def _drop_hc_counters(self, keys: list[str]) -> None:
+        """Go back to the 32-bit octet counters for keys the switch did not answer."""
+        _LOGGER.debug("%s has no 64-bit octet counters for %s, using 32-bit ones", self.host, keys)
+        base_oids = dict(self.base_oids)
+        for key in keys:
+            base_oids[key] = self._hc_fallback.pop(key)
+        self.base_oids = base_oids
+        self._build_walk_plan()
+
+    @property
+    def port_mapping(self) -> dict[int, dict[str, Any]]:
+        """Logical port -> discovered interface info."""
+        return self._port_mapping
+
+    @port_mapping.setter
+    def port_mapping(self, mapping: dict[int, dict[str, Any]]) -> None:
+        self._port_mapping = mapping
+        self._build_port_index()
+
+    def _build_port_index(self) -> None:
+        """Precompute per-port keys, ifIndex and default names aligned with self.ports."""
+        self._port_str = [str(port) for port in self.ports]
+        self._if_index = [
+            (self._port_mapping.get(port) or EMPTY_MAPPING).get("if_index", port)  # fallback to port number
+            for port in self.ports
+        ]
+        self._default_names = [f"Port {port}" for port in self.ports]
+        self._port_by_if_index = dict(zip(self._if_index, self._port_str))
+        self._port_static_attrs = []
+        for port in self.ports:
+            port_info = self._port_mapping.get(port) or EMPTY_MAPPING
+            self._port_static_attrs.append({
+                # SFP / Copper detection (universal — works on Zyxel, TP-Link, QNAP, ASUS, etc.)
+                "is_sfp": bool(port_info.get("is_sfp", False)),
+                "is_copper": bool(port_info.get("is_copper", True)),
+                "interface": port_info.get("if_descr"),  # e.g. "eth5"
+            })
+        self._static_attrs_by_port = dict(zip(self._port_str, self._port_static_attrs))
+        # Slow columns are keyed by ifIndex: refetch them with the new mapping
+        self._slow_columns = None
+        # (rx, tx) octets from the previous poll, aligned with self.ports
+        self._last_octets: list[tuple[int, int] | None] = [None] * len(self.ports)
+
+    async def async_shutdown(self) -> None:
+        """Drop the cached transport when the entry unloads."""
+        await super().async_shutdown()
+        self._target = None
+
+    def register_entities(self, entities: list[SwitchPortBaseEntity]) -> None:
+        """Subscribe all entities through one coordinator listener."""
+        self._entities.update(entities)
+        if self._unsub_fan_out is None:
+            self._unsub_fan_out = self.async_add_listener(self._fan_out)
+
+    def unregister_entity(self, entity: SwitchPortBaseEntity) -> None:
+        """Drop an entity from the fan-out; unsubscribe once none are left."""
+        self._entities.discard(entity)
+        if not self._entities and self._unsub_fan_out is not None:
+            self._unsub_fan_out()
+            self._unsub_fan_out = None
+
+    @property
+    def has_data(self) -> bool:
+        """Last refresh succeeded and there is a snapshot to show."""
+        return self.last_update_success and self.data is not None
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """DeviceInfo shared by every entity of this entry (built once)."""
+        if self._device_info is None:
+            entry_id = self.config_entry.entry_id
+            self._device_info = DeviceInfo(
+                identifiers={(DOMAIN, f"{entry_id}_{self.host}")},
+                connections=set(),
+                name=f"Switch {self.host}",  # temporary before SNMP poll
+                manufacturer="Generic SNMP",
+                model=f"{entry_id}",  # updated dynamically later
+                sw_version=self.data.system.firmware if self.data else None,  # updated dynamically later
+            )
+        return self._device_info
+
+    @callback
+    def _update_device_info(self) -> None:
+        """
+        Update HA device registry with dynamic system info.
+        Shared by all entities of the entry; only writes when something changed.
+        """
+        try:
+            if not self.data:
+                return
+
+            system = self.data.system
+
+            raw_hostname = system.hostname or ""
+            device_name = raw_hostname.strip() or f"Switch {self.host}"
+            model = ""  # no model OID is polled
+            firmware = system.firmware
+            info = (device_name, model, firmware)
+            if info == self._last_device_info:
+                return
+
+            # Update device registry entry
+            dev_reg = device_registry.async_get(self.hass)
+            if self._device_id is None:
+                device_entry = dev_reg.async_get_device(
+                    identifiers={(DOMAIN, f"{self.config_entry.entry_id}_{self.host}")}
+                )
+                if not device_entry:
+                    return  # entities not registered yet, retry next refresh
+                self._device_id = device_entry.id
+            dev_reg.async_update_device(
+                self._device_id,
+                name=device_name,
+                model=model,
+                sw_version=firmware,
+            )
+            self._last_device_info = info
+        except Exception as err:
+            _LOGGER.error("Device info update failed for %s with error %s", self.host, err)
+
+    def _port_attrs(self, row: PortRow, static_attrs: dict[str, Any]) -> dict[str, Any]:
+        """State attributes of one port, as read by the card."""
+        attrs = {
+            "port_name": row.name,
+            "speed_bps": row.speed,
+            # Legacy — kept for old cards / backward compatibility
+            "rx_bps": row.rx_bps,
+            "tx_bps": row.tx_bps,
+            # NEW — real live rates (used when card has show_live_traffic: true)
+            "rx_bps_live": row.rx_bps_live,
+            "tx_bps_live": row.tx_bps_live,
+            **static_attrs,
+            "custom": row.port_custom,
+        }
+        if self.include_vlans and row.vlan is not None:
+            attrs["vlan_id"] = row.vlan
+        if self._has_poe:
+            attrs.update({
+                "poe_power_watts": round(row.poe_power / 1000.0, 2),
+                "poe_enabled": row.poe_status in POE_ENABLED_STATES,
+                "poe_class": row.poe_status,
+            })
+        return attrs
+
+    @callback
+    def async_set_port(self, port: int | str, **fields: Any) -> None:
+        """Merge a partial update into one port's row and push it without an SNMP poll.
+
+        For optimistic updates after a control action or from a faster
+        secondary poller; the next regular refresh overwrites it.
+        """
+        data = self.data
+        key = str(port)
+        if data is None or key not in data.ports:
+            return
+        row = replace(data.ports[key], **fields)
+        # A new snapshot: the published one stays untouched for anyone holding it
+        self.data = replace(
+            data,
+            ports={**data.ports, key: row},
+            port_attrs={**data.port_attrs, key: self._port_attrs(row, self._static_attrs_by_port[key])},
+        )
+        self.async_update_listeners()
+
+    @callback
+    def async_handle_link_trap(self, if_index: int, is_up: bool) -> None:
+        """Apply a linkUp/linkDown trap right away; the next poll confirms it."""
+        port = self._port_by_if_index.get(if_index)
+        if port is not None:
+            self.async_set_port(port, status="on" if is_up else "off")
+
+    @callback
+    def _fan_out(self) -> None:
+        """Write state for every registered entity after a refresh."""
+        try:
+            on_loop = asyncio.get_running_loop() is self.hass.loop
+        except RuntimeError:  # no running loop: a worker thread
+            on_loop = False
+        if not on_loop:
+            # State writes must happen on the event loop
+            self.hass.loop.call_soon_threadsafe(self._fan_out)
+            return
+        self._update_device_info()
+        available = self.has_data
+        for entity in self._entities:
+            if entity.hass is not None:
+                entity.async_write_ha_state_if_changed(available)
+
+    def _apply_backoff(self, failed: bool, fingerprint: tuple | None = None) -> None:
+        """Pick the next poll interval.
+
+        Consecutive failures step through FAILURE_BACKOFF_SECONDS. Successful
+        polls whose totals and link states match the previous poll double the
+        interval (capped), and any change snaps back to the configured one.
+        """
+        if failed:
+            self._consecutive_failures += 1
+            step = min(self._consecutive_failures, len(FAILURE_BACKOFF_SECONDS)) - 1
+            seconds = max(self.update_seconds, FAILURE_BACKOFF_SECONDS[step])
+        else:
+            self._consecutive_failures = 0
+            if fingerprint is not None and fingerprint == self._last_fingerprint:
+                self._unchanged_polls += 1
+            else:
+                self._unchanged_polls = 0
+                self._last_fingerprint = fingerprint
+            seconds = min(
+                self.update_seconds * 2 ** min(self._unchanged_polls, IDLE_MAX_DOUBLINGS),
+                max(IDLE_MAX_INTERVAL_SECONDS, self.update_seconds),
+            )
+        if self.update_interval != timedelta(seconds=seconds):
+            self.update_interval = timedelta(seconds=seconds)
 
     async def _async_update_data(self) -> SwitchPortData:
+        # Nothing is listening (all entities unloaded/disabled): don't touch the switch
+        if not self._listeners and self.data is not None:
+            return self.data
+        # The interval set after the previous poll is the one that just elapsed
+        if self.update_interval:
+            self.poll_seconds = self.update_interval.total_seconds()
         try:
 
             if not self.port_mapping:
@@ -86,292 +555,349 @@ class SwitchPortCoordinator(DataUpdateCoordinator[SwitchPortData]):
                     p: {"if_index": p, "name": f"Port {p}", "is_sfp": False, "is_copper": True}
                     for p in self.ports
                 }   
-            # === PORT WALKS ===
-            oids_to_walk = ["rx", "tx", "status", "speed", "name", "poe_power", "poe_status","port_custom"]
-            if self.include_vlans and self.base_oids.get("vlan"):
-                oids_to_walk.append("vlan")
-
-            tasks = [
-                async_snmp_walk(self.hass, self.host, self.community, self.snmp_port, self.base_oids[k], mp_model=self.mp_model)
-                for k in oids_to_walk if self.base_oids.get(k)
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            walk_map: dict[str, dict[str, str]] = {}
-            for key, result in zip([k for k in oids_to_walk if self.base_oids.get(k)], results):
+            if self._target is None:
+                self._target = await async_create_target(self.host, self.snmp_port)
+            target, auth = self._target, self._auth
+
+            poll_ts = self.hass.loop.time()
+            slow = self._slow_columns is None or poll_ts >= self._slow_due
+            # Until the switch has answered any system OID, retry all of them every poll
+            if slow or not self._system_values:
+                system_oid_list = self._system_oid_list
+            elif poll_ts >= self._load_due:
+                system_oid_list = self._load_oid_list
+            else:
+                system_oid_list = []
+            dead = self._dead_system_oids
+            if dead and system_oid_list:
+                system_oid_list = [oid for oid in system_oid_list if dead.get(oid, 0.0) <= poll_ts]
+            if slow:
+                walk_keys, walk_oids = self._walk_keys, self._walk_oids
+            else:
+                walk_keys, walk_oids = self._fast_walk_keys, self._fast_walk_oids
+
+            # === PORT COLUMNS ===
+            if self.mp_model != 0:
+                # Only the configured ports' cells, packed into a few GET PDUs
+                port_task = async_snmp_get_columns(
+                    self.hass, self.host, self.community, self.snmp_port,
+                    list(walk_oids), self._if_index,
+                    mp_model=self.mp_model, target=target, auth=auth,
+                )
+            else:
+                # SNMPv1: one missing cell fails a whole GET (noSuchName), so walk
+                port_task = async_snmp_bulk_walk(
+                    self.hass, self.host, self.community, self.snmp_port, list(walk_oids),
+                    mp_model=self.mp_model, target=target, auth=auth,
+                )
+            if system_oid_list:
+                unsupported: set[str] = set()
+                system_task = async_snmp_bulk(
+                    self.hass,
+                    self.host,
+                    self.community,
+                    self.snmp_port,
+                    system_oid_list,
+                    mp_model=self.mp_model,
+                    target=target,
+                    auth=auth,
+                    unsupported=unsupported,
+                )
+                columns, raw_system = await asyncio.gather(
+                    port_task, system_task, return_exceptions=True
+                )
+                if isinstance(raw_system, BaseException):
+                    raise raw_system
+                system_answered = any(raw_system.values())
+                # Only an explicit noSuchObject/noSuchInstance/noSuchName marks an
+                # OID dead; a lost exchange just keeps its last good value
+                retry_at = poll_ts + DEAD_OID_RETRY_SECONDS
+                for oid in system_oid_list:
+                    if oid.strip() in unsupported:
+                        dead[oid] = retry_at
+                    elif raw_system.get(oid) is not None:
+                        dead.pop(oid, None)
+                if system_answered:
+                    # Answered OIDs replace their cached value; the rest keep the last good one
+                    self._system_values = {
+                        **self._system_values,
+                        **{oid: (val, poll_ts) for oid, val in raw_system.items() if val is not None},
+                    }
+                else:
+                    # Agent missed the system GET: keep serving the last good values
+                    _LOGGER.debug("System OIDs unanswered on %s, reusing cached values", self.host)
+            else:
+                (columns,) = await asyncio.gather(port_task, return_exceptions=True)
+                system_answered = False
+            if isinstance(columns, Exception):
+                results = [columns] * len(walk_keys)
+            elif isinstance(columns, BaseException):
+                raise columns
+            else:
+                results = [columns.get(oid.strip(), EMPTY_MAPPING) for oid in walk_oids]
+
+            walk_map: dict[str, Mapping[str, Any]] = {}
+            failed: list[tuple[str, BaseException]] = []
+            empty: list[str] = []
+            for key, result in zip(walk_keys, results):
                 if isinstance(result, Exception):
-                    _LOGGER.error("SNMP walk failed for %s: %s", key, result)
-                    walk_map[key] = {}
+                    failed.append((key, result))
+                    walk_map[key] = EMPTY_MAPPING
                 elif not result:
-               #     _LOGGER.warning("SNMP walk empty for %s → using defaults", key) # surpress unneeded log
-                    walk_map[key] = {}
+                    empty.append(key)
+                    walk_map[key] = EMPTY_MAPPING
                 else:
                     walk_map[key] = result
-
-            def parse(raw: dict[str, str], int_val: bool = True) -> dict[int, Any]:
-                out = {}
-                for oid, val in raw.items():
-                    try:
-                        idx = int(oid.split(".")[-1])
-                        out[idx] = int(val) if int_val else val
-                    except (ValueError, IndexError):
-                        continue
-                return out
-
-            rx = parse(walk_map.get("rx", {}))
-            tx = parse(walk_map.get("tx", {}))
-            status = parse(walk_map.get("status", {}))
-            speed = parse(walk_map.get("speed", {}))
-            name = parse(walk_map.get("name", {}), int_val=False)
-            vlan = parse(walk_map.get("vlan", {}))
-            poe_power = parse(walk_map.get("poe_power", {}))
-            poe_status = parse(walk_map.get("poe_status", {}))
-            port_custom = parse(walk_map.get("port_custom", {}))
-
-            ports_data: dict[str, dict[str, Any]] = {}
+            # SNMP timeouts come back as empty results, not exceptions: nothing
+            # answered at all means the switch is unreachable
+            if not system_answered and not any(walk_map.values()):
+                raise UpdateFailed(f"No SNMP response from {self.host}")
+            # One record per refresh instead of one per walk
+            if failed and _LOGGER.isEnabledFor(logging.ERROR):
+                _LOGGER.error("SNMP walk failed on %s: %s", self.host, failed)
+            if empty and _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("SNMP walk empty on %s for %s → using defaults", self.host, empty)
+
+            rx = _parse_column(walk_map.get("rx", EMPTY_MAPPING))
+            tx = _parse_column(walk_map.get("tx", EMPTY_MAPPING))
+            status = _parse_column(walk_map.get("status", EMPTY_MAPPING))
+            speed = _parse_column(walk_map.get("speed", EMPTY_MAPPING))
+            # Switch answers the port table but not ifHC*Octets: fall back for good.
+            # Only decided before the first good refresh, so a hiccup can't trigger it.
+            octets_reset = False
+            if self._hc_fallback and self.data is None and (status or speed):
+                missing = [k for k, col in (("rx", rx), ("tx", tx)) if k in self._hc_fallback and not col]
+                if missing:
+                    self._drop_hc_counters(missing)
+                    octets_reset = True
+            if slow:
+                slow_columns = {
+                    "name": _parse_column(walk_map.get("name", EMPTY_MAPPING), int_val=False),
+                    "vlan": _parse_column(walk_map.get("vlan", EMPTY_MAPPING)),
+                }
+            else:
+                slow_columns = self._slow_columns
+            name, vlan = slow_columns["name"], slow_columns["vlan"]
+            poe_power = _parse_column(walk_map.get("poe_power", EMPTY_MAPPING))
+            poe_status = _parse_column(walk_map.get("poe_status", EMPTY_MAPPING))
+            port_custom = _parse_column(walk_map.get("port_custom", EMPTY_MAPPING))
+
+            ports_data: dict[str, PortRow] = {}
             total_rx = total_tx = total_poe_mw = 0
 
-            for port in self.ports:
-                p = str(port)
-                port_info = self.port_mapping.get(port) or {}
-                if_index = port_info.get("if_index", port)  # fallback to port number if no mapping
-                ports_data[p] = {
-                    "status": "off",
-                    "speed": 0,
-                    "rx": 0,
-                    "tx": 0,
-                    "name": f"Port {port}",
-                    "vlan": None,
-                    "poe_power": 0,
-                    "poe_status": 0,
-                    "port_custom": 0,
-                }
+            # Bind lookups to locals once; the loop below runs per port, per poll
+            g_status, g_speed, g_rx, g_tx = status.get, speed.get, rx.get, tx.get
+            g_name, g_vlan, g_pw, g_ps = name.get, vlan.get, poe_power.get, poe_status.get
+            g_custom = port_custom.get
+            # ifIndexes the switch answered for in any of the core columns
+            answered = status.keys() | speed.keys() | rx.keys() | tx.keys() | poe_power.keys()
+
+            # Bandwidth from per-port counter deltas, so a wrap/reset on one port
+            # is handled on that port's own counter
+            rx_max, tx_max = self._rx_counter_max, self._tx_counter_max
+            new_octets: list[tuple[int, int] | None] = []
+            delta_total = 0
+            clamped: list[str] = []
+
+            # Live rates use the real time between polls, capped at 1.5x the interval
+            now = self.hass.loop.time()
+            poll_seconds = self.poll_seconds
+            elapsed = now - self._last_poll_ts if self._last_poll_ts is not None else 0.0
+            rate_seconds = elapsed if 0 < elapsed < poll_seconds * 1.5 else poll_seconds
+            self._last_poll_ts = now
+
+            for p, if_index, default_name, prev in zip(
+                self._port_str, self._if_index, self._default_names, self._last_octets
+            ):
+                port_rx = g_rx(if_index, 0)
+                port_tx = g_tx(if_index, 0)
+                port_pw = g_pw(if_index, 0)
+                rx_bps_live = tx_bps_live = 0
+                # A missing cell is not a zero counter: no baseline, so the
+                # next poll doesn't count the whole lifetime total as traffic
+                if if_index not in rx or if_index not in tx:
+                    new_octets.append(None)
+                else:
+                    new_octets.append((port_rx, port_tx))
+                    if prev is not None:
+                        delta_rx = _counter_delta(port_rx, prev[0], rx_max)
+                        delta_tx = _counter_delta(port_tx, prev[1], tx_max)
+                        rx_bps_live = int(delta_rx * 8 / rate_seconds)
+                        tx_bps_live = int(delta_tx * 8 / rate_seconds)
+                        # Final safety clamp against spurious counter jumps; a
+                        # dropped delta doesn't count towards the total either
+                        if rx_bps_live > MAX_SAFE_BPS or tx_bps_live > MAX_SAFE_BPS:
+                            clamped.append(p)
+                            if rx_bps_live > MAX_SAFE_BPS:
+                                rx_bps_live = delta_rx = 0
+                            if tx_bps_live > MAX_SAFE_BPS:
+                                tx_bps_live = delta_tx = 0
+                        delta_total += delta_rx + delta_tx
 
                 # Use the real if_index for all lookups
-                if any(if_index in t for t in (status, speed, rx, tx, poe_power)):
-                    HighLowSpeed = speed.get(if_index, 0)
+                if if_index in answered:
+                    HighLowSpeed = g_speed(if_index, 0)
                     if HighLowSpeed < 100000: # check if we use the 32 or 64 bit variant
                         HighLowSpeed = HighLowSpeed * 1000000 # convert to bps
-                    ports_data[p].update({
-                        "status": "on" if status.get(if_index, 2) == 1 else "off",
-                        "speed": HighLowSpeed,
-                        "rx": rx.get(if_index, 0),
-                        "tx": tx.get(if_index, 0),
-                        "name": name.get(if_index, f"Port {port}"),
-                        "vlan": vlan.get(if_index),
-                        "poe_power": poe_power.get(if_index, 0),
-                        "poe_status": poe_status.get(if_index, 0),
-                        "port_custom": port_custom.get(if_index, 0),
-                    })
-
-                total_rx += rx.get(if_index, 0)
-                total_tx += tx.get(if_index, 0)
-                total_poe_mw += poe_power.get(if_index, 0)
-
-            # compute current totals (these are lifetime counters) in bytes
-            current_total_bytes = total_rx + total_tx
-            # compute delta from last poll
-            delta_total = current_total_bytes - getattr(self, "_last_total_bytes", 0)
-            # handle negative (counter reset or wrap) if needed
-            if delta_total < 0:
-                # Heuristic: assume 32-bit wrap if last_total was large
-                MAX32 = 4294967296
-                if getattr(self, "_last_total_bytes", 0) > 3_000_000_000:
-                    delta_total = (MAX32 - self._last_total_bytes) + current_total_bytes
+                    ports_data[p] = PortRow(
+                        status="on" if g_status(if_index, 2) == 1 else "off",
+                        speed=HighLowSpeed,
+                        rx=port_rx,
+                        tx=port_tx,
+                        rx_bps=port_rx * 8,
+                        tx_bps=port_tx * 8,
+                        name=g_name(if_index, default_name),
+                        vlan=g_vlan(if_index),
+                        poe_power=port_pw,
+                        poe_status=g_ps(if_index, 0),
+                        port_custom=g_custom(if_index, 0),
+                        rx_bps_live=rx_bps_live,
+                        tx_bps_live=tx_bps_live,
+                    )
                 else:
-                    # real reset, treat as zero
-                    delta_total = 0
-            # prefer using configured stable interval if available
-            delta_time = getattr(self, "update_seconds", 20)
-            if delta_time <= 0:
-                delta_time = 20
-            # Mbps: megabits per second
-            bandwidth_mbps = round((delta_total * 8) / (1024 * 1024) / delta_time, 2)
-
-            # store for next run
-            self._last_total_bytes = current_total_bytes
+                    ports_data[p] = PortRow(name=default_name)
+
+                total_rx += port_rx
+                total_tx += port_tx
+                total_poe_mw += port_pw
+
+            # One record per refresh, not one per port
+            if clamped:
+                _LOGGER.warning(
+                    "Counter reset or spurious data on %s port(s) %s. Dropping rate data.",
+                    self.host, ", ".join(clamped),
+                )
+            # Mbps over the measured time since the last poll, like the per-port live
+            # rates, so a manual refresh or a backoff change doesn't skew it
+            bandwidth_mbps = delta_total / (BYTES_PER_MEGABIT * rate_seconds)
+            # store for next run (nothing to diff against after a counter switch)
+            self._last_octets = [None] * len(new_octets) if octets_reset else new_octets
+
+            # State attributes are built here once, not on every entity read
+            port_attrs = {
+                p: self._port_attrs(ports_data[p], static)
+                for p, static in zip(self._port_str, self._port_static_attrs)
+            }
             # === SYSTEM OIDs ===
-            raw_system = await async_snmp_bulk(
-                self.hass,
-                self.host,
-                self.community,
-                self.snmp_port,
-                [oid for oid in self.system_oids.values() if oid],
-                mp_model=self.mp_model,
-            )
+            # async_snmp_bulk keys its result by the requested OID strings,
+            # so every configured system OID is a direct dict hit
+            system_values = self._system_values
 
             def get(oid_key: str) -> str | None:
                 oid = self.system_oids.get(oid_key)
-                return next((v for k, v in raw_system.items() if oid and k.startswith(oid)), None)
-
-            system = {
-                "cpu": get("cpu") or get("cpu_zyxel"),
-                "memory": get("memory") or get("memory_zyxel"),
-                "hostname": get("hostname"),
-                "uptime": get("uptime"),
-                "firmware": get("firmware"),
-                "poe_total_watts": round(total_poe_mw / 1000.0, 2) if total_poe_mw > 0 else None,
-                "custom": get("custom"),
-            }
+                entry = system_values.get(oid) if oid else None
+                return entry[0] if entry else None
+
+            # sysUpTime only moves forward: age the cached reading instead of re-fetching it
+            uptime = _as_uptime_seconds(get("uptime"))
+            if uptime:
+                uptime_ts = system_values[self.system_oids["uptime"]][1]
+                if now > uptime_ts:
+                    uptime += int(now - uptime_ts)
+            system = SystemStats(
+                cpu=_as_float(get("cpu") or get("cpu_zyxel")),
+                memory=_as_float(get("memory") or get("memory_zyxel")),
+                hostname=get("hostname"),
+                uptime=uptime,
+                firmware=get("firmware"),
+                poe_total_watts=round(total_poe_mw / 1000.0, 2) if total_poe_mw > 0 else None,
+                custom=get("custom"),
+            )
+
+            # Tiers are rescheduled only after a good poll, so a failed one retries next time
+            if slow:
+                self._slow_columns = slow_columns
+                self._slow_due = poll_ts + SLOW_REFRESH_SECONDS
+            if slow or system_oid_list:
+                self._load_due = poll_ts + LOAD_REFRESH_SECONDS
 
-            return SwitchPortData(ports=ports_data, bandwidth_mbps=bandwidth_mbps, system=system)
+            self._apply_backoff(
+                failed=False,
+                fingerprint=(total_rx, total_tx, tuple(row.status for row in ports_data.values())),
+            )
+            return SwitchPortData(
+                ports=ports_data,
+                bandwidth_mbps=bandwidth_mbps,
+                system=system,
+                port_attrs=port_attrs,
+            )
 
+        except UpdateFailed:
+            # HA logs these itself, once per failure streak
+            self._apply_backoff(failed=True)
+            raise
         except Exception as err:
-            _LOGGER.exception("Update failed for %s", self.host)
+            # Traceback for the first failure of a streak only: a switch that
+            # stays down would otherwise log one per poll
+            if self._consecutive_failures == 0:
+                _LOGGER.exception("Update failed for %s", self.host)
+            else:
+                _LOGGER.debug(
+                    "Update failed for %s (%d in a row): %s",
+                    self.host, self._consecutive_failures + 1, err,
+                )
+            self._apply_backoff(failed=True)
             raise UpdateFailed(str(err)) from err
 
 # =============================================================================
 # Entities
 # =============================================================================
 class SwitchPortBaseEntity(SensorEntity):
+    # HA's Entity keeps its own __dict__; slots cover the attributes we own
+    __slots__ = ("_last_pushed", "coordinator", "entry_id")
+
     _attr_has_entity_name = True
     _attr_should_poll = False
 
     def __init__(self, coordinator: SwitchPortCoordinator, entry_id: str) -> None:
         self.coordinator = coordinator
         self.entry_id = entry_id
+        self._last_pushed: Any = None
+        self._attr_available = coordinator.has_data
 
-        # STATIC DEVICE INFO (never changes)
-        sys_info = coordinator.data.system if coordinator.data else {}
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"{entry_id}_{self.coordinator.host}")},
-            connections=set(),
-            name=f"Switch {self.coordinator.host}",  # temporary before SNMP poll
-            manufacturer=sys_info.get("manufacturer") or "Generic SNMP",
-            model=sys_info.get("model") or f"{entry_id}",          # updated dynamically later
-            sw_version=sys_info.get("firmware"),          # updated dynamically later
-        )
-
-        # Auto update entity state when coordinator updates
-        self._unsub_coordinator = coordinator.async_add_listener(self.async_write_ha_state)
+        # One DeviceInfo object for the whole entry, shared by reference
+        self._attr_device_info = coordinator.device_info
 
     @property
-    def available(self) -> bool:
-        """Return True only if we have data."""
-        try: 
-            return (
-                self.coordinator.last_update_success
-                and self.coordinator.data is not None
-            )
-        except Exception:
-            _LOGGER.error("Entity not available")
+    def _data(self) -> SwitchPortData | None:
+        """Latest coordinator snapshot.
 
-    async def async_will_remove_from_hass(self) -> None:
-        if hasattr(self, '_unsub_coordinator') and self._unsub_coordinator:
-            self._unsub_coordinator()
-        if hasattr(self, '_unsub_devinfo') and self._unsub_devinfo:
-            self._unsub_devinfo()
-        await super().async_will_remove_from_hass()
+        HA only reads native_value/extra_state_attributes while the entity is
+        available, i.e. once data exists, so those properties need no None check.
+        """
+        return self.coordinator.data
 
     async def async_added_to_hass(self) -> None:
+        # Refreshes that finished before the entity was added did not reach it
+        self._attr_available = self.coordinator.has_data
         await super().async_added_to_hass()
 
-        @callback
-        def _update_device_info() -> None:
-            """
-            Update HA device registry with dynamic system info.
-            """
-            try:
-                if not self.coordinator.data:
-                    return
-    
-                system = self.coordinator.data.system
-    
-                raw_hostname = system.get("hostname") or ""
-                device_name = raw_hostname.strip() or f"Switch {self.coordinator.host}"
-                model = (system.get("model") or "")
-                firmware = system.get("firmware")
-    
-                # Update device registry entry
-                dev_reg = device_registry.async_get(self.hass)
-                device_entry = dev_reg.async_get_device(
-                        identifiers={(DOMAIN, f"{self.entry_id}_{self.coordinator.host}")}
-                )
-                if device_entry:
-                    dev_reg.async_update_device(
-                    device_entry.id,
-                    name=device_name,
-                    model=model,
-                    sw_version=firmware,
-                    )
-            except Exception as err:
-                _LOGGER.error("Entity update failed for %s with error %s", self.host, err)
-    
-        # Run on each coordinator update
-        self._unsub_devinfo = self.coordinator.async_add_listener(_update_device_info)
-
-        # Also run immediately on entity creation (if we already have data)
-        if self.coordinator.data:
-            _update_device_info()
-
-
-
-
-# --- Aggregate and Port Sensors ---
-class TotalPoESensor(SwitchPortBaseEntity):
-    _attr_name = "Total PoE Power"
-    _attr_native_unit_of_measurement = "W"
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(self, coordinator: SwitchPortCoordinator, entry_id: str) -> None:
-        super().__init__(coordinator, entry_id)
-        self._attr_unique_id = f"{entry_id}_total_poe"
-
-    @property
-    def native_value(self) -> float | None:
-        if not self.coordinator.data:
-            return 0
-        try:
-            val = self.coordinator.data.system.get("poe_total_watts")
-            return float(val) if val is not None else None
-        except (ValueError, TypeError):
-            return 0
-        
-class BandwidthSensor(SwitchPortBaseEntity):
-    """Total bandwidth sensor."""
-
-    _attr_name = "Total Bandwidth"
-    _attr_native_unit_of_measurement = UnitOfDataRate.MEGABITS_PER_SECOND
-    _attr_device_class = SensorDeviceClass.DATA_RATE
-    _attr_icon = "mdi:speedometer"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_unique_id_suffix = "total_bandwidth_mbps"
-
-    def __init__(self, coordinator: SwitchPortCoordinator, entry_id: str) -> None:
-        super().__init__(coordinator, entry_id)
-        self._attr_unique_id = f"{entry_id}_{self._attr_unique_id_suffix}"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return 0
-        try:
-            val = self.coordinator.data.bandwidth_mbps
-            return float(val) if val is not None else None
-        except (ValueError, TypeError):
-            return 0
-
-class FirmwareSensor(SwitchPortBaseEntity):
-    _attr_name = "Firmware"
-    _attr_icon = "mdi:chip"
+    def _state_signature(self) -> Any:
+        """Values that decide whether a state write is needed (None = always write)."""
+        if not self.available:
+            return (False, None)
+        return (True, self.native_value)
+
+    @callback
+    def async_write_ha_state_if_changed(self, available: bool) -> None:
+        """Write state only when the signature differs from the last written one."""
+        # Availability is set by the fan-out, not recomputed on every read
+        self._attr_available = available
+        signature = self._state_signature()
+        if signature is not None and signature == self._last_pushed:
+            return
+        self._last_pushed = signature
+        self.async_write_ha_state()
 
-    def __init__(self, coordinator: SwitchPortCoordinator, entry_id: str) -> None:
-        super().__init__(coordinator, entry_id)
-        self._attr_unique_id = f"{entry_id}_firmware"
+    async def async_will_remove_from_hass(self) -> None:
+        self.coordinator.unregister_entity(self)
+        await super().async_will_remove_from_hass()
 
-    @property
-    def native_value(self) -> str | None:
-        if not self.coordinator.data:
-            return ""
-        try:
-            return self.coordinator.data.system.get("firmware")
-        except (ValueError, TypeError):
-            return ""
-        
+# --- Port Sensors ---
 class PortStatusSensor(SwitchPortBaseEntity):
     """Port status (on/off) sensor, acting as the primary port entity."""
+    __slots__ = ("_attrs", "_row", "port")
+
     _attr_has_entity_name = True
     _attr_should_poll = False
     
@@ -382,233 +908,135 @@ class PortStatusSensor(SwitchPortBaseEntity):
         self._attr_unique_id = f"{entry_id}_{self.coordinator.host}_port_{port}_status"
         self._attr_icon = "mdi:lan"
 
-        # For live traffic calculation
-        self._last_rx_bytes: int | None = None
-        self._last_tx_bytes: int | None = None
-        self._last_update: float | None = None
+        # This port's row and attributes from the latest snapshot; properties serve these
+        self._row: PortRow = EMPTY_PORT_ROW
+        self._attrs: Mapping[str, Any] = EMPTY_MAPPING
+
+    def _sync_port(self) -> None:
+        """Pick this port's row and attributes out of the current snapshot."""
+        data = self._data
+        if data is not None:
+            self._row = data.ports.get(self.port, EMPTY_PORT_ROW)
+            self._attrs = data.port_attrs.get(self.port, EMPTY_MAPPING)
+
+    async def async_added_to_hass(self) -> None:
+        # The first state write follows right after this, before any fan-out
+        self._sync_port()
+        await super().async_added_to_hass()
+
+    def _state_signature(self) -> Any:
+        """The port row (live rates included) drives all attributes."""
+        # Runs once per fan-out, ahead of any state write
+        self._sync_port()
+        if self._data is None:
+            return None
+        return (self.available, self._row)
 
     @property
     def native_value(self) -> str | None:
         """Return the state (on/off)."""
-        if not self.coordinator.data:
-            return ""
-        try:
-            return self.coordinator.data.ports.get(self.port, {}).get("status")
-        except (ValueError, TypeError):
-            return ""
+        return self._row.status
 
     @property
     def icon(self) -> str | None:
         """Return the icon based on state."""
-        return "mdi:lan-connect" if self.native_value == "on" else "mdi:lan-disconnect"
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        if not self.coordinator.data:
-            return {}
-        try:    
-            p = self.coordinator.data.ports.get(self.port, {})
-    
-            # === LIFETIME VALUES (always available) ===
-            raw_rx_bytes = p.get("rx", 0)
-            raw_tx_bytes = p.get("tx", 0)
-    
-            # === LIVE RATE CALCULATION (only if we have previous data) ===
-            now = datetime.now().timestamp()
-            rx_bps_live = 0
-            tx_bps_live = 0
-    
-            if (self._last_rx_bytes is not None
-                and self._last_tx_bytes is not None
-                and self._last_update is not None
-                and now > self._last_update):
-    
-                actual_delta = now - self._last_update
-                delta_time = actual_delta if actual_delta < (self.coordinator.update_seconds * 1.5) else self.coordinator.update_seconds
-    
-                if delta_time > 0:
-                    # --- RAW DELTAS ---
-                    delta_rx = raw_rx_bytes - self._last_rx_bytes
-                    delta_tx = raw_tx_bytes - self._last_tx_bytes
-            
-                    # --- HANDLE 32-bit WRAPAROUND ---
-                    # Most switches use 32-bit counters for ifHC* until > 4GB
-                    MAX32 = 4294967296  # 2^32
-            
-                    if delta_rx < 0:
-                        # If previous value was "close" to wrap limit → wrap happened
-                        if self._last_rx_bytes > 3_000_000_000:
-                            delta_rx = (MAX32 - self._last_rx_bytes) + raw_rx_bytes
-            
-                    if delta_tx < 0:
-                        if self._last_tx_bytes > 3_000_000_000:
-                            delta_tx = (MAX32 - self._last_tx_bytes) + raw_tx_bytes
-    
-            
-                    # --- COMPUTE LIVE BPS ---
-                    rx_bps_live = int(delta_rx * 8 / delta_time)
-                    tx_bps_live = int(delta_tx * 8 / delta_time)
-            
-                    # --- FINAL SAFETY CLAMP ---
-                    MAX_SAFE_BPS = 20_000_000_000
-                    if rx_bps_live < 0 or rx_bps_live > MAX_SAFE_BPS:
-                        _LOGGER.warning("RX counter reset or spurious data detected. Dropping rate data.")
-                        rx_bps_live = 0
-                        
-                    if tx_bps_live < 0 or tx_bps_live > MAX_SAFE_BPS:
-                        _LOGGER.warning("TX counter reset or spurious data detected. Dropping rate data.")
-                        tx_bps_live = 0
-    
-            # Store for next poll
-            self._last_rx_bytes = raw_rx_bytes
-            self._last_tx_bytes = raw_tx_bytes
-            self._last_update = now
-            port_info = self.coordinator.port_mapping.get(int(self.port), {})
-            has_poe = (
-                p.get("poe_power", 0) > 0 or
-                p.get("poe_status", 0) > 0 or
-                self.coordinator.base_oids.get("poe_power") or
-                self.coordinator.base_oids.get("poe_status")
-            )
-            attrs = {
-                "port_name": p.get("name"),
-                "speed_bps": p.get("speed"),
-                # Legacy — kept for old cards / backward compatibility
-                "rx_bps": raw_rx_bytes * 8,
-                "tx_bps": raw_tx_bytes * 8,
-                # NEW — real live rates (used when card has show_live_traffic: true)
-                "rx_bps_live": rx_bps_live,
-                "tx_bps_live": tx_bps_live,
-                # SFP / Copper detection (universal — works on Zyxel, TP-Link, QNAP, ASUS, etc.)
-                "is_sfp": bool(port_info.get("is_sfp", False)),
-                "is_copper": bool(port_info.get("is_copper", True)),
-                "interface": port_info.get("if_descr"),  # e.g. "eth5"
-                "custom": p.get("port_custom"),
-            }
-            if self.coordinator.include_vlans and p.get("vlan") is not None:
-                attrs["vlan_id"] = p["vlan"]
-            if has_poe:
-                attrs.update({
-                    "poe_power_watts": round(p.get("poe_power", 0) / 1000.0, 2),
-                    "poe_enabled": p.get("poe_status") in (1, 2, 4),
-                    "poe_class": p.get("poe_status"),
-                })
-            return attrs
-        except Exception as e:
-          _LOGGER.debug("Error calculating live traffic for port %s: %s", self.port, e)
-        return {}
-
-# --- System Sensors ---
-
-class SystemCpuSensor(SwitchPortBaseEntity):
-    """CPU usage sensor."""
-    _attr_name = "CPU Usage"
-    _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_device_class = None
-    _attr_icon = "mdi:cpu-64-bit"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_unique_id_suffix = "system_cpu"
-
-    def __init__(self, coordinator: SwitchPortCoordinator, entry_id: str) -> None:
-        super().__init__(coordinator, entry_id)
-        self._attr_unique_id = f"{entry_id}_{self._attr_unique_id_suffix}"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return 0
-        try:
-            return float(self.coordinator.data.system.get("cpu") or 0)
-        except (ValueError, TypeError):
-            return 0
-            
-class CustomValueSensor(SwitchPortBaseEntity):
-    _attr_name = "Custom Value"
-    _attr_icon = "mdi:text-box-search"
-
-    def __init__(self, coordinator, entry_id):
-        super().__init__(coordinator, entry_id)
-        self._attr_unique_id = f"{entry_id}_custom_value"
+        return "mdi:lan-connect" if self._row.status == "on" else "mdi:lan-disconnect"
 
     @property
-    def native_value(self):
-        """Return the custom OID value safely."""
-        if not self.coordinator.data:
-            return ""
-        try:
-            return self.coordinator.data.system.get("custom")
-        except (ValueError, TypeError):
-            return ""
+    def extra_state_attributes(self) -> Mapping[str, Any]:
+        """Attributes are assembled by the coordinator once per refresh."""
+        return self._attrs
 
-class SystemMemorySensor(SwitchPortBaseEntity):
-    """Memory usage sensor."""
-    _attr_name = "Memory Usage"
-    _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_device_class = None
-    _attr_icon = "mdi:memory"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_unique_id_suffix = "system_memory"
-
-    def __init__(self, coordinator: SwitchPortCoordinator, entry_id: str) -> None:
-        super().__init__(coordinator, entry_id)
-        self._attr_unique_id = f"{entry_id}_{self._attr_unique_id_suffix}"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return 0
-        try:
-            return float(self.coordinator.data.system.get("memory") or 0)
-        except (ValueError, TypeError):
-            return 0
+# --- Switch-wide Sensors ---
 
+class SwitchValueSensor(SwitchPortBaseEntity):
+    """One switch-wide value from the coordinator snapshot, chosen by _value_of."""
+    __slots__ = ()
 
-class SystemUptimeSensor(SwitchPortBaseEntity):
-    """System Uptime sensor."""
-    _attr_name = "Uptime"
-    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
-    _attr_device_class = SensorDeviceClass.DURATION
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_unique_id_suffix = "system_uptime"
+    _attr_unique_id_suffix: str
+    _value_of: Callable[[SwitchPortData], Any]
 
     def __init__(self, coordinator: SwitchPortCoordinator, entry_id: str) -> None:
         super().__init__(coordinator, entry_id)
         self._attr_unique_id = f"{entry_id}_{self._attr_unique_id_suffix}"
 
     @property
-    def native_value(self) -> int | None:
-        """Return the state of the sensor (in seconds)."""
-        if not self.coordinator.data:
-            return 0
-        try:
-            # Uptime OID typically returns hundredths of a second. Convert to seconds.
-            uptime_hsec = int(self.coordinator.data.system.get("uptime") or 0)
-            return int(uptime_hsec / 100)
-        except (ValueError, TypeError):
-            return 0
-
-
-class SystemHostnameSensor(SwitchPortBaseEntity):
-    """System Hostname sensor (for device name info)."""
-    _attr_name = "Hostname"
-    _attr_icon = "mdi:dns"
-    _attr_unique_id_suffix = "system_hostname"
-
-    def __init__(self, coordinator: SwitchPortCoordinator, entry_id: str) -> None:
-        super().__init__(coordinator, entry_id)
-        self._attr_unique_id = f"{entry_id}_{self._attr_unique_id_suffix}"
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return ""
-        try:
-            return self.coordinator.data.system.get("hostname")
-        except (ValueError, TypeError):
-            return ""
+    def native_value(self) -> Any:
+        """Return the state of the sensor (already parsed by the coordinator)."""
+        return self._value_of(self._data)
+
+
+def _switch_sensor(
+    class_name: str,
+    doc: str,
+    *,
+    name: str,
+    unique_id_suffix: str,
+    value: str,
+    unit: str | None = None,
+    device_class: SensorDeviceClass | None = None,
+    state_class: SensorStateClass | None = None,
+    icon: str | None = None,
+    display_precision: int | None = None,
+) -> type[SwitchValueSensor]:
+    """Build a SwitchValueSensor subclass reading the dotted attribute path `value`."""
+    return type(class_name, (SwitchValueSensor,), {
+        "__slots__": (),
+        "__doc__": doc,
+        "__module__": __name__,
+        "_attr_name": name,
+        "_attr_unique_id_suffix": unique_id_suffix,
+        # attrgetter is not a descriptor, so it is called with the snapshot only
+        "_value_of": attrgetter(value),
+        "_attr_native_unit_of_measurement": unit,
+        "_attr_device_class": device_class,
+        "_attr_state_class": state_class,
+        "_attr_icon": icon,
+        "_attr_suggested_display_precision": display_precision,
+    })
+
+
+# unique_id suffixes are the historical ones: changing them would orphan entities
+BandwidthSensor = _switch_sensor(
+    "BandwidthSensor", "Total bandwidth sensor.",
+    name="Total Bandwidth", unique_id_suffix="total_bandwidth_mbps", value="bandwidth_mbps",
+    unit=UnitOfDataRate.MEGABITS_PER_SECOND, device_class=SensorDeviceClass.DATA_RATE,
+    state_class=SensorStateClass.MEASUREMENT, icon="mdi:speedometer", display_precision=2,
+)
+TotalPoESensor = _switch_sensor(
+    "TotalPoESensor", "Total PoE power sensor.",
+    name="Total PoE Power", unique_id_suffix="total_poe", value="system.poe_total_watts",
+    unit="W", device_class=SensorDeviceClass.POWER, state_class=SensorStateClass.MEASUREMENT,
+)
+FirmwareSensor = _switch_sensor(
+    "FirmwareSensor", "Firmware version sensor.",
+    name="Firmware", unique_id_suffix="firmware", value="system.firmware", icon="mdi:chip",
+)
+SystemCpuSensor = _switch_sensor(
+    "SystemCpuSensor", "CPU usage sensor.",
+    name="CPU Usage", unique_id_suffix="system_cpu", value="system.cpu",
+    unit=PERCENTAGE, state_class=SensorStateClass.MEASUREMENT, icon="mdi:cpu-64-bit",
+)
+CustomValueSensor = _switch_sensor(
+    "CustomValueSensor", "Custom OID value sensor.",
+    name="Custom Value", unique_id_suffix="custom_value", value="system.custom",
+    icon="mdi:text-box-search",
+)
+SystemMemorySensor = _switch_sensor(
+    "SystemMemorySensor", "Memory usage sensor.",
+    name="Memory Usage", unique_id_suffix="system_memory", value="system.memory",
+    unit=PERCENTAGE, state_class=SensorStateClass.MEASUREMENT, icon="mdi:memory",
+)
+SystemUptimeSensor = _switch_sensor(
+    "SystemUptimeSensor", "System Uptime sensor (seconds).",
+    name="Uptime", unique_id_suffix="system_uptime", value="system.uptime",
+    unit=UnitOfTime.SECONDS, device_class=SensorDeviceClass.DURATION,
+    state_class=SensorStateClass.MEASUREMENT,
+)
+SystemHostnameSensor = _switch_sensor(
+    "SystemHostnameSensor", "System Hostname sensor (for device name info).",
+    name="Hostname", unique_id_suffix="system_hostname", value="system.hostname", icon="mdi:dns",
+)
 
 
 # =============================================================================
@@ -622,19 +1050,27 @@ async def async_setup_entry(
     """Set up the platform from config_entry. vlans override always to true"""
     coordinator = hass.data[DOMAIN][entry.entry_id]
     # Create entities
-    entities = [
-        BandwidthSensor(coordinator, entry.entry_id),
-        TotalPoESensor(coordinator, entry.entry_id),
-        SystemCpuSensor(coordinator, entry.entry_id),
-        CustomValueSensor(coordinator, entry.entry_id),
-        FirmwareSensor(coordinator, entry.entry_id),
-        SystemMemorySensor(coordinator, entry.entry_id),
-        SystemUptimeSensor(coordinator, entry.entry_id),
-        SystemHostnameSensor(coordinator, entry.entry_id),
+    # Bandwidth is always present (the card anchors on it)
+    entities: list[SwitchPortBaseEntity] = [BandwidthSensor(coordinator, entry.entry_id)]
+
+    # The rest only exist when the OID that feeds them is configured
+    optional_sensors = [
+        (TotalPoESensor, coordinator.base_oids.get("poe_power")),
+        (SystemCpuSensor, coordinator.system_oids.get("cpu")),
+        (CustomValueSensor, coordinator.system_oids.get("custom")),
+        (FirmwareSensor, coordinator.system_oids.get("firmware")),
+        (SystemMemorySensor, coordinator.system_oids.get("memory")),
+        (SystemUptimeSensor, coordinator.system_oids.get("uptime")),
+        (SystemHostnameSensor, coordinator.system_oids.get("hostname")),
     ]
+    entities.extend(
+        sensor_cls(coordinator, entry.entry_id) for sensor_cls, oid in optional_sensors if oid
+    )
 
     # Per-port status sensors (traffic/speed data lives in attributes)
     for port in coordinator.ports:
         entities.append(PortStatusSensor(coordinator, entry.entry_id, port))
 
+    # One coordinator listener fans out state writes to all entities
+    coordinator.register_entities(entities)
     async_add_entities(entities)
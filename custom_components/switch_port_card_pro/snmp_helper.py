@@ -3,6 +3,8 @@ from __future__ import annotations
 import logging
 import re
 import asyncio
+import socket
+from collections.abc import Callable
 from typing import Dict, Any
 
 from pysnmp.hlapi.v3arch.asyncio import (
@@ -12,9 +14,16 @@ from pysnmp.hlapi.v3arch.asyncio import (
     ContextData,
     ObjectType,
     ObjectIdentity,
+    bulk_cmd,
     get_cmd,
     walk_cmd,
 )
+from pyasn1.type.univ import Integer
+from pysnmp.carrier.asyncio.dgram import udp
+from pysnmp.entity import config
+from pysnmp.entity.rfc3413 import ntfrcv
+from pysnmp.error import PySnmpError
+from pysnmp.proto.rfc1905 import EndOfMibView, NoSuchInstance, NoSuchObject
 from .const import (
     CONF_OID_IDESCR,
     CONF_OID_IFTYPE,
@@ -28,6 +37,28 @@ _LOGGER = logging.getLogger(__name__)
 # Global engine and lock for thread-safe initialization
 _SNMP_ENGINE = None
 _ENGINE_LOCK = asyncio.Lock()
+# SNMP error-status tooBig(1)
+_ERR_TOO_BIG = 1
+# Varbinds per GET PDU when fetching table cells by instance
+_GET_VARBINDS_PER_PDU = 48
+# snmpTrapOID.0 and its linkDown/linkUp values (v1 generic traps 2/3 map onto these)
+_SNMP_TRAP_OID = "1.3.6.1.6.3.1.1.4.1.0"
+_LINK_DOWN_OID = "1.3.6.1.6.3.1.1.5.3"
+_LINK_UP_OID = "1.3.6.1.6.3.1.1.5.4"
+# ifTable columns; link traps carry ifIndex/ifOperStatus instances of these
+_IF_TABLE_OID = "1.3.6.1.2.1.2.2.1."
+# One notification receiver per UDP port, shared by all switches using it
+_TRAP_LISTENERS: dict[int, _TrapListener] = {}
+_TRAP_LOCK = asyncio.Lock()
+# Default (empty) SNMP context; immutable, so one instance serves every request
+_CONTEXT = ContextData()
+
+
+def _table_value(value: Any) -> int | str:
+    """Table cell as a Python value: numbers (counters, gauges, enums) stay int."""
+    if isinstance(value, Integer):
+        return int(value)
+    return value.prettyPrint()
 
 
 async def _ensure_engine(hass):
@@ -46,6 +77,37 @@ async def _ensure_engine(hass):
     return _SNMP_ENGINE
 
 
+def close_engine() -> None:
+    """Shut down the shared engine's dispatcher (last config entry unloaded)."""
+    global _SNMP_ENGINE
+
+    if _SNMP_ENGINE is not None:
+        try:
+            _SNMP_ENGINE.close_dispatcher()
+        except (PySnmpError, OSError, RuntimeError) as exc:
+            _LOGGER.debug("SNMP engine close failed: %s", exc)
+        _SNMP_ENGINE = None
+        _LOGGER.debug("SNMP engine closed")
+
+
+def create_auth(community: str, mp_model: int = 1) -> CommunityData:
+    """Build community auth data once for reuse across requests."""
+    return CommunityData(community, mpModel=mp_model)
+
+
+async def async_create_target(
+    host: str,
+    snmp_port: int,
+    timeout: int = 10,
+    retries: int = 3,
+) -> UdpTransportTarget:
+    """Create a transport target that callers can reuse across requests."""
+    transport = await UdpTransportTarget.create((host, snmp_port))
+    transport.timeout = timeout
+    transport.retries = retries
+    return transport
+
+
 async def async_snmp_get(
     hass,
     host: str,
@@ -55,26 +117,35 @@ async def async_snmp_get(
     timeout: int = 10,
     retries: int = 3,
     mp_model: int = 1,
+    target: UdpTransportTarget | None = None,
+    auth: CommunityData | None = None,
+    unsupported: set[str] | None = None,
 ) -> str | None:
-    """Ultra-reliable async SNMP GET."""
+    """Ultra-reliable async SNMP GET.
+
+    Pass a cached ``target``/``auth`` to skip per-call transport and
+    community setup; ``timeout``/``retries`` then come from the target.
+    ``None`` means no value; when the agent explicitly reported the OID as
+    nonexistent it is also added to ``unsupported`` (a timeout is not).
+    """
     if not oid or not oid.strip():
         return None
     
     engine = await _ensure_engine(hass)
-    transport = None
+    transport = target
     
     try:
-        transport = await UdpTransportTarget.create((host, snmp_port))
-        transport.timeout = timeout
-        transport.retries = retries
+        if transport is None:
+            transport = await async_create_target(host, snmp_port, timeout, retries)
         obj_identity = ObjectIdentity(oid)
         
         error_indication, error_status, error_index, var_binds = await get_cmd(
             engine,
-            CommunityData(community, mpModel=mp_model),
+            auth or CommunityData(community, mpModel=mp_model),
             transport,
-            ContextData(),
+            _CONTEXT,
             ObjectType(obj_identity),
+            lookupMib=False,  # numeric OIDs in, raw values out: no MIB resolution
         )
 
         if error_indication:
@@ -87,11 +158,20 @@ async def async_snmp_get(
         if error_status:
             msg = error_status.prettyPrint()
             if "noSuchName" in msg or "noSuchObject" in msg:
+                if unsupported is not None:
+                    unsupported.add(oid)
                 return None
             _LOGGER.debug("SNMP GET error status: %s", msg)
             return None
 
-        return var_binds[0][1].prettyPrint() if var_binds else None
+        if not var_binds:
+            return None
+        value = var_binds[0][1]
+        if isinstance(value, (NoSuchInstance, NoSuchObject, EndOfMibView)):
+            if unsupported is not None:
+                unsupported.add(oid)
+            return None
+        return value.prettyPrint()
 
     except asyncio.CancelledError:
         raise
@@ -109,34 +189,37 @@ async def async_snmp_walk(
     timeout: int = 10,
     retries: int = 3,
     mp_model: int = 1,
-) -> dict[str, str]:
+    target: UdpTransportTarget | None = None,
+    auth: CommunityData | None = None,
+) -> dict[str, Any]:
     """
     Async SNMP WALK using the high-level walkCmd.
-    Returns {full_oid: value} for all OIDs under base_oid.
+    Returns {full_oid: value} for all OIDs under base_oid (see _table_value).
+    A cached ``target``/``auth`` is used as-is when given.
     """
     if not base_oid or not base_oid.strip():
         return {}
 
     engine = await _ensure_engine(hass)
-    results: dict[str, str] = {}
-    transport = None
+    results: dict[str, Any] = {}
+    transport = target
 
     try:
-        # Create and configure transport
-        transport = await UdpTransportTarget.create((host, snmp_port))
-        transport.timeout = timeout
-        transport.retries = retries
+        # Create and configure transport unless the caller keeps one
+        if transport is None:
+            transport = await async_create_target(host, snmp_port, timeout, retries)
 
         # Use walk_cmd for the operation
         obj_identity = ObjectIdentity(base_oid)
         iterator = walk_cmd(
             engine,
-            CommunityData(community, mpModel=mp_model),
+            auth or CommunityData(community, mpModel=mp_model),
             transport,
-            ContextData(),
+            _CONTEXT,
             ObjectType(obj_identity),
             lexicographicMode=False,
             ignoreNonIncreasingOid=True,
+            lookupMib=False,
         )
         
         try:
@@ -155,7 +238,7 @@ async def async_snmp_walk(
                     # Double-check we are still in the tree
                     if not oid_str.startswith(base_oid):
                         return results
-                    results[oid_str] = value.prettyPrint()
+                    results[oid_str] = _table_value(value)
         except asyncio.CancelledError:
             raise
         except Exception as iter_err:
@@ -169,6 +252,215 @@ async def async_snmp_walk(
     return results
 
 
+async def async_snmp_bulk_walk(
+    hass,
+    host: str,
+    community: str,
+    snmp_port: int,
+    base_oids: list[str],
+    max_repetitions: int = 50,
+    timeout: int = 10,
+    retries: int = 3,
+    mp_model: int = 1,
+    target: UdpTransportTarget | None = None,
+    auth: CommunityData | None = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Walk several table columns at once with shared GETBULK PDUs.
+    Returns {base_oid: {full_oid: value}}. SNMPv1 has no GETBULK, so it
+    falls back to one walk per column.
+    """
+    columns = list(dict.fromkeys(oid.strip() for oid in base_oids if oid and oid.strip()))
+    results: dict[str, dict[str, Any]] = {oid: {} for oid in columns}
+    if not columns:
+        return results
+
+    if mp_model == 0:
+        walks = await asyncio.gather(*[
+            async_snmp_walk(
+                hass, host, community, snmp_port, oid,
+                timeout=timeout, retries=retries, mp_model=mp_model,
+                target=target, auth=auth,
+            )
+            for oid in columns
+        ])
+        return dict(zip(columns, walks))
+
+    engine = await _ensure_engine(hass)
+    transport = target
+    if transport is None:
+        transport = await async_create_target(host, snmp_port, timeout, retries)
+    auth = auth or CommunityData(community, mpModel=mp_model)
+
+    # Next OID to request per column that is still inside its subtree
+    cursors = {oid: oid for oid in columns}
+    while cursors:
+        active = list(cursors)
+        error_indication, error_status, _, var_binds = await bulk_cmd(
+            engine,
+            auth,
+            transport,
+            _CONTEXT,
+            0,
+            max_repetitions,
+            *[ObjectType(ObjectIdentity(cursors[oid])) for oid in active],
+            lookupMib=False,
+        )
+        if error_indication:
+            _LOGGER.debug("SNMP BULK error on %s: %s", host, error_indication)
+            break
+        if error_status:
+            if int(error_status) == _ERR_TOO_BIG and max_repetitions > 1:
+                # Response did not fit the agent's message size: ask for fewer rows
+                max_repetitions //= 2
+                continue
+            _LOGGER.debug("SNMP BULK error status on %s: %s", host, error_status.prettyPrint())
+            break
+        if not var_binds:
+            break
+
+        # Response rows repeat the requested columns in order
+        progressed = False
+        finished: set[str] = set()
+        for i, (oid, value) in enumerate(var_binds):
+            column = active[i % len(active)]
+            if column in finished:
+                continue
+            oid_str = str(oid)
+            if isinstance(value, EndOfMibView) or not oid_str.startswith(column + "."):
+                finished.add(column)
+                continue
+            if oid_str in results[column]:
+                finished.add(column)  # agent is looping, stop this column
+                continue
+            results[column][oid_str] = _table_value(value)
+            cursors[column] = oid_str
+            progressed = True
+        for column in finished:
+            cursors.pop(column, None)
+        if not progressed:
+            break
+
+    return results
+
+
+async def async_snmp_get_columns(
+    hass,
+    host: str,
+    community: str,
+    snmp_port: int,
+    base_oids: list[str],
+    indexes: list[int],
+    timeout: int = 10,
+    retries: int = 3,
+    mp_model: int = 1,
+    target: UdpTransportTarget | None = None,
+    auth: CommunityData | None = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Fetch only the given rows of several table columns with multi-varbind GETs.
+    Returns {base_oid: {full_oid: value}} like async_snmp_bulk_walk; rows the
+    agent does not have are left out. PDUs are sent concurrently.
+    """
+    columns = list(dict.fromkeys(oid.strip() for oid in base_oids if oid and oid.strip()))
+    results: dict[str, dict[str, Any]] = {oid: {} for oid in columns}
+    if not columns or not indexes:
+        return results
+
+    engine = await _ensure_engine(hass)
+    transport = target
+    if transport is None:
+        transport = await async_create_target(host, snmp_port, timeout, retries)
+    auth = auth or CommunityData(community, mpModel=mp_model)
+
+    cells = [(column, f"{column}.{index}") for column in columns for index in indexes]
+
+    async def _get_chunk(chunk: list[tuple[str, str]]) -> None:
+        error_indication, error_status, _, var_binds = await get_cmd(
+            engine,
+            auth,
+            transport,
+            _CONTEXT,
+            *[ObjectType(ObjectIdentity(oid)) for _, oid in chunk],
+            lookupMib=False,
+        )
+        if error_indication:
+            _LOGGER.debug("SNMP GET error on %s: %s", host, error_indication)
+            return
+        if error_status:
+            if int(error_status) == _ERR_TOO_BIG and len(chunk) > 1:
+                # Response did not fit the agent's message size: split the request
+                half = len(chunk) // 2
+                await asyncio.gather(_get_chunk(chunk[:half]), _get_chunk(chunk[half:]))
+                return
+            _LOGGER.debug("SNMP GET error status on %s: %s", host, error_status.prettyPrint())
+            return
+        # Varbinds come back in request order
+        for (column, oid), (_, value) in zip(chunk, var_binds):
+            if isinstance(value, (NoSuchInstance, NoSuchObject, EndOfMibView)):
+                continue
+            results[column][oid] = _table_value(value)
+
+    await asyncio.gather(*[
+        _get_chunk(cells[i:i + _GET_VARBINDS_PER_PDU])
+        for i in range(0, len(cells), _GET_VARBINDS_PER_PDU)
+    ])
+    return results
+
+
+async def _async_get_scalars(
+    hass,
+    host: str,
+    community: str,
+    snmp_port: int,
+    oids: list[str],
+    timeout: int,
+    retries: int,
+    mp_model: int,
+    target: UdpTransportTarget | None,
+    auth: CommunityData | None,
+    unsupported: set[str] | None = None,
+) -> dict[str, str] | None:
+    """
+    GET several scalars in a single PDU. Returns {oid: value} for the OIDs the
+    agent has, or None when the agent rejected the PDU as a whole. OIDs the
+    agent reported as nonexistent are added to ``unsupported``.
+    """
+    try:
+        engine = await _ensure_engine(hass)
+        transport = target
+        if transport is None:
+            transport = await async_create_target(host, snmp_port, timeout, retries)
+        error_indication, error_status, _, var_binds = await get_cmd(
+            engine,
+            auth or CommunityData(community, mpModel=mp_model),
+            transport,
+            _CONTEXT,
+            *[ObjectType(ObjectIdentity(oid)) for oid in oids],
+            lookupMib=False,
+        )
+    except (PySnmpError, OSError, TimeoutError) as exc:
+        # Anything else is a bug and goes up to the coordinator's UpdateFailed
+        _LOGGER.debug("SNMP GET exception on %s: %s", host, exc)
+        return None
+
+    if error_indication:
+        # Unreachable: per-OID retries would only time out again
+        _LOGGER.debug("SNMP GET error on %s: %s", host, error_indication)
+        return {}
+    if error_status:
+        _LOGGER.debug("SNMP GET error status on %s: %s", host, error_status.prettyPrint())
+        return None
+    values: dict[str, str] = {}
+    for oid, (_, value) in zip(oids, var_binds):
+        if isinstance(value, (NoSuchInstance, NoSuchObject, EndOfMibView)):
+            if unsupported is not None:
+                unsupported.add(oid)
+        else:
+            values[oid] = value.prettyPrint()
+    return values
+
+
 async def async_snmp_bulk(
     hass,
     host: str,
@@ -178,8 +470,15 @@ async def async_snmp_bulk(
     timeout: int = 8,
     retries: int = 2,
     mp_model: int = 1,
+    target: UdpTransportTarget | None = None,
+    auth: CommunityData | None = None,
+    unsupported: set[str] | None = None,
 ) -> Dict[str, str | None]:
-    """Fast parallel GET for system OIDs. Skips empty/blank OIDs."""
+    """Fast GET for system OIDs (one PDU on v2c+, parallel GETs on v1). Skips empty/blank OIDs.
+
+    OIDs (stripped) the agent explicitly reported as nonexistent are added to
+    ``unsupported``, so callers can tell them apart from timeouts.
+    """
     if not oid_list:
         return {}
 
@@ -197,11 +496,26 @@ async def async_snmp_bulk(
     if not filtered_oids:
         return results_template
 
+    # SNMPv2c+: every scalar in one PDU, missing ones come back as noSuchObject.
+    # (v1 fails the whole PDU on one missing OID, so it keeps per-OID GETs.)
+    if mp_model != 0:
+        values = await _async_get_scalars(
+            hass, host, community, snmp_port, filtered_oids,
+            timeout=timeout, retries=retries, mp_model=mp_model,
+            target=target, auth=auth, unsupported=unsupported,
+        )
+        if values is not None:
+            return {
+                oid: values.get(oid.strip() if oid else "")
+                for oid in oid_list
+            }
+
     # Perform parallel GET only on valid OIDs
     async def _get_one(oid: str):
         return await async_snmp_get(
             hass, host, community, snmp_port, oid,
-            timeout=timeout, retries=retries, mp_model=mp_model
+            timeout=timeout, retries=retries, mp_model=mp_model,
+            target=target, auth=auth, unsupported=unsupported,
         )
 
     valid_results = await asyncio.gather(*[_get_one(oid) for oid in filtered_oids])
@@ -219,6 +533,101 @@ async def async_snmp_bulk(
     return final_results
 
 
+class _TrapListener:
+    """Receives traps on one UDP port and hands link changes to the switch that sent them."""
+
+    def __init__(self, engine: SnmpEngine, port: int) -> None:
+        self.engine = engine
+        self.port = port
+        # source IP -> callback(if_index, is_up)
+        self.handlers: dict[str, Callable[[int, bool], None]] = {}
+        self._communities: set[str] = set()
+        self._receiver = ntfrcv.NotificationReceiver(engine, self._on_notification)
+
+    def add_community(self, community: str) -> None:
+        """Accept v1/v2c notifications sent with this community."""
+        if community in self._communities:
+            return
+        config.add_v1_system(self.engine, f"trap-{len(self._communities)}", community)
+        self._communities.add(community)
+
+    def _on_notification(
+        self, snmp_engine, state_reference, context_engine_id, context_name, var_binds, cb_ctx
+    ) -> None:
+        _, address = snmp_engine.message_dispatcher.get_transport_info(state_reference)
+        handler = self.handlers.get(address[0])
+        if handler is None:
+            return
+        trap_oid = None
+        if_index = None
+        for oid, value in var_binds:
+            oid_str = str(oid)
+            if oid_str == _SNMP_TRAP_OID:
+                trap_oid = str(value)
+            elif if_index is None and oid_str.startswith(_IF_TABLE_OID):
+                suffix = oid_str.rpartition(".")[2]
+                if suffix.isdigit():
+                    if_index = int(suffix)
+        if if_index is None or trap_oid not in (_LINK_UP_OID, _LINK_DOWN_OID):
+            return
+        handler(if_index, trap_oid == _LINK_UP_OID)
+
+    def close(self) -> None:
+        self._receiver.close(self.engine)
+        self.engine.close_dispatcher()
+
+
+async def async_listen_link_traps(
+    hass,
+    trap_port: int,
+    host: str,
+    community: str,
+    handler: Callable[[int, bool], None],
+) -> Callable[[], None]:
+    """
+    Call handler(if_index, is_up) for linkUp/linkDown traps sent by host.
+    Returns a function that stops listening. Raises OSError if the port
+    cannot be bound.
+    """
+    try:
+        infos = await hass.loop.getaddrinfo(host, None, type=socket.SOCK_DGRAM)
+        address = infos[0][4][0]
+    except OSError:
+        address = host
+
+    async with _TRAP_LOCK:
+        listener = _TRAP_LISTENERS.get(trap_port)
+        if listener is None:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            try:
+                sock.setblocking(False)
+                sock.bind(("0.0.0.0", trap_port))
+            except OSError:
+                sock.close()
+                raise
+            # Engine setup loads MIB modules from disk: keep it off the event loop
+            engine = await hass.async_add_executor_job(SnmpEngine)
+            config.add_transport(
+                engine, udp.DOMAIN_NAME, udp.UdpAsyncioTransport().open_server_mode(sock=sock)
+            )
+            listener = _TrapListener(engine, trap_port)
+            _TRAP_LISTENERS[trap_port] = listener
+            _LOGGER.debug("Listening for SNMP traps on UDP %s", trap_port)
+
+        listener.add_community(community)
+        listener.handlers[address] = handler
+
+    def _stop() -> None:
+        if listener.handlers.get(address) is handler:
+            del listener.handlers[address]
+        if not listener.handlers and _TRAP_LISTENERS.get(trap_port) is listener:
+            del _TRAP_LISTENERS[trap_port]
+            listener.close()
+            _LOGGER.debug("Stopped listening for SNMP traps on UDP %s", trap_port)
+
+    return _stop
+
+
 async def discover_physical_ports(
     hass,
     host: str,
@@ -234,50 +643,44 @@ async def discover_physical_ports(
     logical_port = 1
 
     try:
-        # Step 1: Get interface descriptions
-        descr_data = await async_snmp_walk(
-            hass, host, community, snmp_port, CONF_OID_IDESCR, mp_model=mp_model
+        # Steps 1-3: ifDescr/ifType/ifSpeed/ifHighSpeed share GETBULK PDUs
+        # (concurrent walks on v1), fetched alongside sysDescr for manufacturer info
+        columns, sys_descr = await asyncio.gather(
+            async_snmp_bulk_walk(
+                hass, host, community, snmp_port,
+                [CONF_OID_IDESCR, CONF_OID_IFTYPE, CONF_OID_IFSPEED, CONF_OID_IFHIGHSPEED],
+                mp_model=mp_model,
+            ),
+            async_snmp_get(
+                hass, host, community, snmp_port, CONF_OID_SYSDESCR, mp_model=mp_model
+            ),
         )
+        descr_data = columns[CONF_OID_IDESCR]
         if not descr_data:
             _LOGGER.debug("discover_physical_ports: no ifDescr data from %s", host)
             return {}
-        
-        _LOGGER.debug("ifDescr data from %s: %d interfaces found", host, len(descr_data))
-        
-        # Step 2: Get interface types (for reliable SFP detection)
-        type_data = await async_snmp_walk(
-            hass, host, community, snmp_port, CONF_OID_IFTYPE, mp_model=mp_model
-        )
-        _LOGGER.debug("ifType data from %s: %d types found", host, len(type_data))
-        
-        # Step 3: Get speed data
-        speed_data = await async_snmp_walk(
-            hass, host, community, snmp_port, CONF_OID_IFSPEED, mp_model=mp_model
-        )
-        high_speed_data = await async_snmp_walk(
-            hass, host, community, snmp_port, CONF_OID_IFHIGHSPEED, mp_model=mp_model
-        )
-        
-        # Step 4: Get sysDescr for manufacturer info
-        sys_descr_data = await async_snmp_walk(
-            hass, host, community, snmp_port, CONF_OID_SYSDESCR, mp_model=mp_model
+        type_data = columns[CONF_OID_IFTYPE]
+        speed_data = columns[CONF_OID_IFSPEED]
+        high_speed_data = columns[CONF_OID_IFHIGHSPEED]
+        _LOGGER.debug(
+            "ifDescr data from %s: %d interfaces found, %d types",
+            host, len(descr_data), len(type_data),
         )
-        sys_descr = list(sys_descr_data.values())[0] if sys_descr_data else "Unknown"
+        sys_descr = sys_descr or "Unknown"
         _LOGGER.debug("sysDescr from %s: %s", host, sys_descr)
         
         # Extract manufacturer from sysDescr
         manufacturer = _extract_manufacturer(sys_descr)
         
-        sorted_oids = sorted(descr_data.keys(), key=lambda x: int(x.split('.')[-1]))
-        for oid_str in sorted_oids:
-            descr_raw = descr_data[oid_str]
-            try:
-                # Extract ifIndex from the end of the OID
-                if_index = int(oid_str.split(".")[-1])
-                descr_clean = descr_raw.strip()
-                descr_lower = descr_clean.lower()
-            except (ValueError, IndexError, AttributeError):
-                continue
+        # ifIndex is the OID's last arc; rows without a numeric one are skipped
+        interfaces = sorted(
+            (int(suffix), str(descr))
+            for oid_str, descr in descr_data.items()
+            if (suffix := oid_str.rpartition(".")[2]).isdigit()
+        )
+        for if_index, descr_raw in interfaces:
+            descr_clean = descr_raw.strip()
+            descr_lower = descr_clean.lower()
             
             # === STEP 1: Reject obvious virtual/junk interfaces ===
             if _is_virtual_interface(descr_lower):
@@ -399,13 +802,8 @@ def _is_physical_interface(descr_lower: str, descr_clean: str, if_index: int) ->
 
 def _get_interface_type(type_data: dict, if_index: int) -> int:
     """Extract interface type from SNMP data."""
-    raw_type = "0"
-    
-    for t_oid, t_val in type_data.items():
-        if t_oid.endswith(f".{if_index}"):
-            raw_type = t_val
-            break
-    
+    raw_type = type_data.get(f"{CONF_OID_IFTYPE}.{if_index}", "0")
+
     try:
         # Handle types like "ethernetCsmacd(6)"
         if '(' in str(raw_type):